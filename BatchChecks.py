@@ -0,0 +1,83 @@
+# Copyright 2025 Amazon.com, Inc. and its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: LicenseRef-.amazon.com.-AmznSL-1.0
+# Licensed under the Amazon Software License (the "License").
+# You may not use this file except in compliance with the License.
+# A copy of the License is located at
+#    http://aws.amazon.com/asl/
+# or in the "license" file accompanying this file. This file is distributed
+# on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either
+# express or implied. See the License for the specific language governing
+# permissions and limitations under the License.
+
+import asyncio
+
+from CheckApiExists import check_api_exists
+from CheckMethodExists import check_method_exists
+from CheckResourceExists import check_resource_exists
+from CheckStageExists import check_stage_exists
+
+
+async def _run_checks(event: dict) -> dict:
+    """
+    Runs the API, stage, resource and method checks concurrently.
+
+    Args:
+        event (dict): Same parameters accepted by the individual Check* handlers
+
+    Returns:
+        dict: Merged results of all checks
+
+    Note:
+        The sync handlers are run in worker threads so their API Gateway round trips overlap.
+        The method check needs a resource ID, so when the event does not provide one it runs
+        after the resource check has resolved it.
+    """
+    checks = [
+        asyncio.to_thread(check_api_exists, event, None),
+        asyncio.to_thread(check_stage_exists, event, None),
+        asyncio.to_thread(check_resource_exists, event, None),
+    ]
+    if event.get("ResourceId", ""):
+        checks.append(asyncio.to_thread(check_method_exists, event, None))
+        api, stage, resource, method = await asyncio.gather(*checks)
+    else:
+        api, stage, resource = await asyncio.gather(*checks)
+        method = await asyncio.to_thread(check_method_exists, {**event, "ResourceId": resource["ResourceId"]}, None)
+
+    return {
+        "ApiExists": api["ApiExists"],
+        "StageExists": stage["StageExists"],
+        "AccessLogGroup": stage["AccessLogGroup"],
+        "ResourceExists": resource["ResourceExists"],
+        "ResourceId": event.get("ResourceId", "") or resource["ResourceId"],
+        "MethodExists": method["MethodExists"],
+        "Authorized": all(result["Authorized"] for result in (api, stage, resource, method)),
+    }
+
+
+def batch_checks(event: dict, _) -> dict:
+    """
+    Main handler for running all API Gateway existence checks in a single step.
+
+    Args:
+        event (dict): Contains required parameters:
+            - RestApiId (str): ID of the API Gateway REST API
+            - StageName (str): Stage name to check
+            - ResourcePath (str): Resource path to check
+            - HttpMethod (str): HTTP method to verify (GET, POST, PUT, etc.)
+            - ResourceId (str, optional): ID of the resource, if already known
+        _ (dict): Lambda context object (not used)
+
+    Returns:
+        dict: Contains existence and authorization status for every check
+              {
+                  "ApiExists": bool,
+                  "StageExists": bool,
+                  "AccessLogGroup": str,
+                  "ResourceExists": bool,
+                  "ResourceId": str,
+                  "MethodExists": bool,
+                  "Authorized": bool
+              }
+    """
+    return asyncio.run(_run_checks(event))
@@ -10,8 +10,25 @@
 # permissions and limitations under the License.
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+CLIENT_CONFIG = Config(max_pool_connections=10, retries={"mode": "standard"})
+_APIGW = None
+
+
+def _apigw():
+    """
+    Return the API Gateway client, creating it on first use.
+
+    Note:
+        Kept at module scope so warm invocations reuse the client and its connection pool.
+    """
+    global _APIGW
+    if _APIGW is None:
+        _APIGW = boto3.client("apigateway", config=CLIENT_CONFIG)
+    return _APIGW
+
 
 def check_api_exists(event, _) -> dict:
     """
@@ -28,7 +45,7 @@ def check_api_exists(event, _) -> dict:
                   "Authorized": bool
               }
     """
-    apigw = boto3.client("apigateway")
+    apigw = _apigw()
     api_id = event.get("RestApiId", "")
     if not api_id:
         return {"ApiExists": False, "Authorized": True}
@@ -12,15 +12,98 @@
 import re
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from dateutil import parser
 
-BACKOFF_RATE = 1.5
+# Sleeps, in seconds, before each Logs Insights poll; the query is abandoned once they run out
+POLL_SCHEDULE = (0.1, 0.25, 0.5, 1.0) + (2.0,) * 9 + (4.0,) * 10
+QUERY_TIMEOUT = sum(POLL_SCHEDULE)
+RESULT_CACHE_TTL = 30
+RESULT_CACHE_SIZE = 64
+CLIENT_CONFIG = Config(max_pool_connections=10, retries={"mode": "standard"})
+_LOGS = None
+# (api_id, stage, start_time, end_time, request_id, access_logs_arn) -> (time.monotonic() when stored, result)
+_RESULT_CACHE: dict[tuple, tuple[float, str]] = {}
 
 
-def validate_time_range(start_time: str, end_time: str) -> bool:
+def _logs():
+    """
+    Return the CloudWatch Logs client, creating it on first use.
+
+    Note:
+        Kept at module scope so warm invocations reuse the client and its connection pool.
+    """
+    global _LOGS
+    if _LOGS is None:
+        _LOGS = boto3.client("logs", config=CLIENT_CONFIG)
+    return _LOGS
+
+
+@lru_cache(maxsize=256)
+def _parse_ts(timestamp: str) -> int:
+    """
+    Parse a timestamp string into a Unix timestamp.
+
+    Args:
+        timestamp (str): Timestamp string, ideally in ISO 8601 format
+
+    Returns:
+        int: Unix timestamp in seconds
+
+    Note:
+        Tries datetime.fromisoformat first and only falls back to the slower
+        dateutil parser for non-ISO input. dateutil is imported on that path only,
+        keeping it out of cold starts. Results are memoized per container.
+    """
+    try:
+        return int(datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        from dateutil import parser
+
+        return int(parser.parse(timestamp).timestamp())
+
+
+def _get_cached_result(key: tuple):
+    """
+    Return the analysis stored for key, or None if there is none or it is older than RESULT_CACHE_TTL seconds.
+    """
+    cached = _RESULT_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < RESULT_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def _cache_result(key: tuple, result: str):
+    """
+    Store an analysis result, dropping expired entries and then the oldest ones to stay within RESULT_CACHE_SIZE.
+    """
+    now = time.monotonic()
+    if len(_RESULT_CACHE) >= RESULT_CACHE_SIZE:
+        for expired in [k for k, (stored, _) in _RESULT_CACHE.items() if now - stored >= RESULT_CACHE_TTL]:
+            del _RESULT_CACHE[expired]
+    while len(_RESULT_CACHE) >= RESULT_CACHE_SIZE:
+        del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+    _RESULT_CACHE[key] = (now, result)
+
+
+def validate_time_range(start_ts: int, end_ts: int) -> bool:
+    """
+    Validate that start_ts is before end_ts.
+
+    Args:
+        start_ts (int): Start time in Unix timestamp format
+        end_ts (int): End time in Unix timestamp format
+
+    Returns:
+        bool: True if time range is valid, False otherwise
+    """
+    return start_ts < end_ts
+
+
+def validate_time_range_strings(start_time: str, end_time: str) -> bool:
     """
     Validate that start_time is before end_time.
 
@@ -29,13 +112,11 @@ def validate_time_range(start_time: str, end_time: str) -> bool:
         end_time (str): End time string in ISO format
 
     Returns:
-        bool: True if time range is valid, False otherwise
+        bool: True if time range is valid or either time is missing, False otherwise
     """
     if start_time and end_time:
         try:
-            start = parser.parse(start_time)
-            end = parser.parse(end_time)
-            return start < end
+            return validate_time_range(_parse_ts(start_time), _parse_ts(end_time))
         except Exception as e:
             print(f"[ERROR] Invalid time format: {str(e)}")
             return False
@@ -43,6 +124,15 @@ def validate_time_range(start_time: str, end_time: str) -> bool:
 
 
 class ErrorPattern:
+    __slots__ = (
+        "_pattern",
+        "_articles",
+        "_articles_str",
+        "redact",
+        "redacted_message_pattern",
+        "_compiled",
+        "_compiled_redact",
+    )
 
     def __init__(self, pattern, articles, redacted_message_pattern=r"", redact=True):
         """
@@ -56,12 +146,17 @@ class ErrorPattern:
 
         Note:
             Used to identify specific error patterns in API Gateway logs and
-            provide relevant troubleshooting articles.
+            provide relevant troubleshooting articles. Both patterns are compiled
+            once here; they are deliberately compiled without re.DOTALL so a match
+            never extends past the log line it was found on.
         """
         self._pattern = pattern
-        self._articles = articles
+        self._articles = tuple(articles)
+        self._articles_str = "\n- ".join(articles)
         self.redact = redact
         self.redacted_message_pattern = redacted_message_pattern
+        self._compiled = re.compile(pattern)
+        self._compiled_redact = re.compile(redacted_message_pattern) if redacted_message_pattern else None
 
     @property
     def pattern(self):
@@ -71,35 +166,67 @@ class ErrorPattern:
     def articles(self):
         return self._articles
 
+    @property
+    def articles_str(self):
+        return self._articles_str
+
+    @property
+    def compiled(self):
+        return self._compiled
+
+    @property
+    def compiled_redact(self):
+        return self._compiled_redact
+
+
+def _required_literal(pattern):
+    """
+    Finds a plain substring that every match of a pattern must contain.
+
+    Args:
+        pattern (str): Regex pattern made of literal text, character classes and single-character quantifiers
+
+    Returns:
+        str: Longest literal run of the pattern, or an empty string when none is guaranteed
+
+    Note:
+        Patterns with groups or alternation return an empty string, so they always pass the prefilter.
+    """
+    if "(" in pattern or "|" in pattern:
+        return ""
+    # Character classes, escapes, quantified characters and other metacharacters all break a literal run
+    runs = re.split(r"(?:\[[^\]]*\]|\\.)(?:[?*+]|\{[^}]*\})?|.(?:[?*+]|\{[^}]*\})|[.^$]", pattern)
+    return max(runs, key=len)
+
 
 ERRORS = [
     ErrorPattern(
-        pattern=r"(.*[Nn]etwork error communicating with endpoint.*)",
+        pattern=r"[^\n]*[Nn]etwork error communicating with endpoint[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-network-endpoint-error"],
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*Execution failed due to configuration error: Invalid endpoint address.*)",
+        pattern=r"[^\n]*Execution failed due to configuration error: Invalid endpoint address[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-invalid-endpoint-address"],
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*Execution failed due to a timeout error.*)",
+        pattern=r"[^\n]*Execution failed due to a timeout error[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-lambda-integration-errors"],
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*Malformed Lambda proxy response.*)",
+        pattern=r"[^\n]*Malformed Lambda proxy response[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-lambda-integration-errors"],
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*Lambda invocation failed with status: 429.*)",
+        pattern=r"[^\n]*Lambda invocation failed with status: 429[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-lambda-integration-errors"],
         redact=False,
     ),
     ErrorPattern(
-        pattern=r".*401 Unauthorized.*",
+        pattern=r"[^\n]*401 Unauthorized[^\n]*",
         articles=[
             "https://repost.aws/knowledge-center/api-gateway-cognito-401-unauthorized",
             "https://repost.aws/knowledge-center/api-gateway-401-error-lambda-authorizer",
@@ -108,7 +235,7 @@ ERRORS = [
         redacted_message_pattern=r"(\([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\)).*(401 Unauthorized).*",
     ),
     ErrorPattern(
-        pattern=r"(.*Missing Authentication Token.*)",
+        pattern=r"[^\n]*Missing Authentication Token[^\n]*",
         articles=[
             "https://repost.aws/knowledge-center/api-gateway-authentication-token-errors",
             "https://repost.aws/knowledge-center/api-gateway-troubleshoot-403-forbidden",
@@ -116,7 +243,7 @@ ERRORS = [
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*not authorized to perform: execute-api:Invoke on resource.*)",
+        pattern=r"[^\n]*not authorized to perform: execute-api:Invoke on resource[^\n]*",
         articles=[
             "https://repost.aws/knowledge-center/api-gateway-403-error-lambda-authorizer",
             "https://repost.aws/knowledge-center/api-gateway-troubleshoot-403-forbidden",
@@ -125,13 +252,13 @@ ERRORS = [
         redacted_message_pattern=r"(\([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\)).*(not authorized to perform: execute-api:Invoke on resource).*",
     ),
     ErrorPattern(
-        pattern=r"(.*not authorized to access this resource.*)",
+        pattern=r"[^\n]*not authorized to access this resource[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-403-error-lambda-authorizer"],
         redact=True,
         redacted_message_pattern=r"(\([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\)).*(not authorized to access this resource).*",
     ),
     ErrorPattern(
-        pattern=r"(.*User: anonymous is not authorized to perform: execute-api:Invoke on resource.*)",
+        pattern=r"[^\n]*User: anonymous is not authorized to perform: execute-api:Invoke on resource[^\n]*",
         articles=[
             "https://repost.aws/knowledge-center/api-gateway-403-error-lambda-authorizer",
             "https://repost.aws/knowledge-center/api-gateway-troubleshoot-403-forbidden",
@@ -140,33 +267,33 @@ ERRORS = [
         redacted_message_pattern=r"(\([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\)).*(not authorized to perform: execute-api:Invoke on resource).*",
     ),
     ErrorPattern(
-        pattern=r"(.*User is not authorized to access this resource with an explicit deny.*)",
+        pattern=r"[^\n]*User is not authorized to access this resource with an explicit deny[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-troubleshoot-403-forbidden"],
         redact=True,
         redacted_message_pattern=r"(\([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\)).*(not authorized to perform: execute-api:Invoke on resource).*",
     ),
     ErrorPattern(
-        pattern=r"(.*The security token included in the request is invalid.*)",
+        pattern=r"[^\n]*The security token included in the request is invalid[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-troubleshoot-403-forbidden"],
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*Signature expired.*)",
+        pattern=r"[^\n]*Signature expired[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-troubleshoot-403-forbidden"],
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*Invalid API Key identifier specified.*)",
+        pattern=r"[^\n]*Invalid API Key identifier specified[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-troubleshoot-403-forbidden"],
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*The request signature we calculated does not match the signature you provided.*)",
+        pattern=r"[^\n]*The request signature we calculated does not match the signature you provided[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-troubleshoot-403-forbidden"],
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*Forbidden.*)",
+        pattern=r"[^\n]*Forbidden[^\n]*",
         articles=[
             "https://repost.aws/knowledge-center/api-gateway-troubleshoot-403-forbidden",
             "https://repost.aws/knowledge-center/api-gateway-vpc-connections",
@@ -174,23 +301,35 @@ ERRORS = [
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*Authorization header requires.*)",
+        pattern=r"[^\n]*Authorization header requires[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-troubleshoot-403-forbidden"],
         redact=True,
         redacted_message_pattern=r"(\([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\)).*(Authorization header requires).*",
     ),
     ErrorPattern(
-        pattern=r"(.*Method completed with status: 502.*)",
+        pattern=r"[^\n]*Method completed with status: 502[^\n]*",
         articles=["https://repost.aws/knowledge-center/malformed-502-api-gateway"],
         redact=False,
     ),
     ErrorPattern(
-        pattern=r"(.*Execution failed due to configuration error.*)",
+        pattern=r"[^\n]*Execution failed due to configuration error[^\n]*",
         articles=["https://repost.aws/knowledge-center/api-gateway-500-error-vpc"],
         redact=False,
     ),
 ]
 
+# All patterns fused into one alternation, matched against one log line at a time.
+# Patterns use [^\n]* rather than .* so a match can never cross a line boundary, whatever the flags.
+# Group "e<i>" maps a match back to ERRORS[i]; at a given line the lowest matching index wins.
+_COMBINED = re.compile("|".join(f"(?P<e{i}>{error.pattern})" for i, error in enumerate(ERRORS)))
+
+# Parallel views of ERRORS indexed like the "e<i>" groups, read directly by analyse_logs
+_ARTICLES = tuple(error.articles_str for error in ERRORS)
+_REDACT = tuple(error.redact for error in ERRORS)
+_REDACT_PATTERNS = tuple(error.compiled_redact for error in ERRORS)
+# Substring each pattern needs; a fast "in" check over the whole blob rules out most patterns before any regex runs
+_LITERALS = tuple(_required_literal(error.pattern) for error in ERRORS)
+
 
 def analyse_logs(query_logs, access_log_message):
     """
@@ -214,47 +353,54 @@ def analyse_logs(query_logs, access_log_message):
     if access_log_message:
         access_log_message = f"\n{access_log_message}"
     if query_logs:
-        for error in ERRORS:
-            found = re.search(error.pattern, query_logs)
-            if found:
-                log_line = query_logs[found.start() : found.end()]
-                if error.redact:
-                    to_redact = re.search(error.redacted_message_pattern, log_line)
-                    log_line = (
-                        " ".join([match for match in to_redact.groups()]) + " [sensitive information has been redacted]"
-                    )
-                articles = "\n- ".join(error.articles)
-                return f"Found the following error:\n\nLog: {log_line}\n\nRecommended articles:\n{articles}{access_log_message}"
+        candidates = [i for i, literal in enumerate(_LITERALS) if literal in query_logs]
+        if not candidates:
+            return "No error were found in the log group during the time range provided."
+
+        # ERRORS is ordered by priority: keep the earliest line matching the lowest-index pattern.
+        # Lines are sorted @timestamp desc, so that is the most recent occurrence of that error.
+        log_line = None
+        found_index = len(ERRORS)
+        for line in query_logs.split("\n"):
+            match = _COMBINED.match(line)
+            if match:
+                index = int(match.lastgroup[1:])
+                if index < found_index:
+                    log_line, found_index = line, index
+                    # No line can match a pattern whose literal is absent from the logs
+                    if index == candidates[0]:
+                        break
+        if log_line is not None:
+            if _REDACT[found_index]:
+                to_redact = _REDACT_PATTERNS[found_index].search(log_line)
+                log_line = (
+                    " ".join([match for match in to_redact.groups()]) + " [sensitive information has been redacted]"
+                )
+            articles = _ARTICLES[found_index]
+            return f"Found the following error:\n\nLog: {log_line}\n\nRecommended articles:\n{articles}{access_log_message}"
         return "No error were found in the log group during the time range provided."
     else:
         return "No log group was found for the API."
 
 
-def log_insights_query(query, log_group, start_time, end_time, is_access_log_query):
+def start_insights_query(query, log_group, start_time, end_time):
     """
-    Executes a CloudWatch Logs Insights query with exponential backoff retry.
+    Starts a CloudWatch Logs Insights query without waiting for it to complete.
 
     Args:
         query (str): CloudWatch Logs Insights query string
         log_group (str): Name of the log group to query
         start_time (int): Start time in Unix timestamp format
         end_time (int): End time in Unix timestamp format
-        is_access_log_query (bool): Whether this is an access log query
 
     Returns:
-        str: Query results joined as a single string, or None if log group not found
+        str: ID of the started query, or None if log group not found
 
     Raises:
-        SystemExit: If query fails with an unexpected error
-
-    Note:
-        - Uses exponential backoff for query polling
-        - Handles ResourceNotFoundException differently for access logs
-        - Joins multiple log lines with newlines
+        RuntimeError: If the query fails to start with an unexpected error
     """
-    logs = boto3.client("logs")
     try:
-        query_response = logs.start_query(
+        query_response = _logs().start_query(
             logGroupName=log_group, startTime=start_time, endTime=end_time, queryString=query
         )
     except ClientError as e:
@@ -264,14 +410,41 @@ def log_insights_query(query, log_group, start_time, end_time, is_access_log_que
         else:
             print(f"[ERROR] Failed to start CloudWatch Logs Insights query: {error_code} - {str(e)}")
             raise RuntimeError(f"CloudWatch Logs error: {error_code} - {str(e)}")
-    query_id = query_response["queryId"]
+    return query_response["queryId"]
+
+
+def wait_for_insights_query(query_id, is_access_log_query):
+    """
+    Polls a started CloudWatch Logs Insights query until it completes.
+
+    Args:
+        query_id (str): ID returned by start_insights_query, or None if log group not found
+        is_access_log_query (bool): Whether this is an access log query
 
-    response = logs.get_query_results(queryId=query_id)
-    wait = 1
-    while response["status"] == "Running":
+    Returns:
+        str: Query results joined as a single string, or None if log group not found
+
+    Raises:
+        RuntimeError: If the query fails or does not complete within QUERY_TIMEOUT seconds
+
+    Note:
+        - Polls early, then at the fixed intervals in POLL_SCHEDULE
+        - Failed access log queries are not treated as errors
+        - Joins multiple log lines with newlines
+    """
+    if query_id is None:
+        return None
+    logs = _logs()
+
+    # Queries over small log groups often finish in well under a second, so the schedule starts short
+    for wait in POLL_SCHEDULE:
         time.sleep(wait)
-        wait *= BACKOFF_RATE
         response = logs.get_query_results(queryId=query_id)
+        if response["status"] not in ["Scheduled", "Running"]:
+            break
+    else:
+        print(f"[ERROR] CloudWatch Log Insights query {query_id} did not complete within {QUERY_TIMEOUT} seconds")
+        raise RuntimeError(f"CloudWatch Logs Insights query timed out after {QUERY_TIMEOUT} seconds")
 
     if not is_access_log_query and response["status"] in ["Failed", "Timeout", "Cancelled", "Unknown"]:
         print(f"[ERROR] CloudWatch Log Insights query failed. Query status: {response['status']}")
@@ -281,6 +454,27 @@ def log_insights_query(query, log_group, start_time, end_time, is_access_log_que
     return "\n".join([line[0]["value"] for line in query_result])
 
 
+def log_insights_query(query, log_group, start_time, end_time, is_access_log_query):
+    """
+    Executes a CloudWatch Logs Insights query and polls until it completes.
+
+    Args:
+        query (str): CloudWatch Logs Insights query string
+        log_group (str): Name of the log group to query
+        start_time (int): Start time in Unix timestamp format
+        end_time (int): End time in Unix timestamp format
+        is_access_log_query (bool): Whether this is an access log query
+
+    Returns:
+        str: Query results joined as a single string, or None if log group not found
+
+    Raises:
+        RuntimeError: If query fails with an unexpected error or does not complete within QUERY_TIMEOUT seconds
+    """
+    query_id = start_insights_query(query, log_group, start_time, end_time)
+    return wait_for_insights_query(query_id, is_access_log_query)
+
+
 def check_logs(event: dict, _) -> dict:
     """
     Main handler for checking API Gateway logs for errors.
@@ -311,7 +505,7 @@ def check_logs(event: dict, _) -> dict:
     start_time = event.get("StartTime", "")
     if start_time:
         try:
-            start_time = int(parser.parse(event["StartTime"]).timestamp())
+            start_time = _parse_ts(start_time)
         except Exception as e:
             print(f"[ERROR] Invalid StartTime format: {event['StartTime']} - {str(e)}")
             raise ValueError(f"Invalid StartTime format: {event['StartTime']}")
@@ -321,37 +515,50 @@ def check_logs(event: dict, _) -> dict:
     end_time = event.get("EndTime", "")
     if end_time:
         try:
-            end_time = int(parser.parse(end_time).timestamp())
+            end_time = _parse_ts(end_time)
         except Exception as e:
             print(f"[ERROR] Invalid EndTime format: {end_time} - {str(e)}")
             raise ValueError(f"Invalid EndTime format: {end_time}")
     else:
         end_time = int(datetime.now().timestamp())
 
-    # Validate time range
-    if not validate_time_range(event.get("StartTime", ""), event.get("EndTime", "")):
+    # Validate time range, only when both ends were provided
+    if event.get("StartTime") and event.get("EndTime") and not validate_time_range(start_time, end_time):
         print("[ERROR] StartTime must be before EndTime")
         raise ValueError("StartTime must be before EndTime")
 
     request_id = event.get("RequestId", "")
     access_logs_arn = event.get("AccessLogName", "")
 
+    # Re-running the same check within RESULT_CACHE_TTL seconds reuses the previous analysis
+    cache_key = (api_id, stage, start_time, end_time, request_id, access_logs_arn)
+    cached_result = _get_cached_result(cache_key)
+    if cached_result is not None:
+        return cached_result
+
     log_group = f"API-Gateway-Execution-Logs_{api_id}/{stage}"
     access_log_message = ""
 
-    if access_logs_arn:
-        access_log_group = access_logs_arn.split(":")[-1]
-        # specifically looking for 5XX errors
-        access_logs_query = 'fields @message | filter status like "5" | sort @timestamp desc'
-        access_logs = log_insights_query(access_logs_query, access_log_group, start_time, end_time, True)
-        if access_logs:
-            access_log_message = "5XX errors found in access logs. Recommended article for review:\nhttps://repost.aws/knowledge-center/api-gateway-find-5xx-errors-cloudwatch"
-
     query = "fields @message | sort @timestamp desc"
     if request_id:
         query = (
             f'fields @message | parse @message "(*) *" as rid, msg | filter rid = "{request_id}" | sort @timestamp desc'
         )
 
-    cw_logs = log_insights_query(query, log_group, start_time, end_time, False)
-    return analyse_logs(cw_logs, access_log_message)
\ No newline at end of file
+    # Start both queries before polling either, so they run on CloudWatch concurrently
+    access_logs_query_id = None
+    if access_logs_arn:
+        access_log_group = access_logs_arn.split(":")[-1]
+        # specifically looking for 5XX errors
+        access_logs_query = 'fields @message | filter status like "5" | sort @timestamp desc'
+        access_logs_query_id = start_insights_query(access_logs_query, access_log_group, start_time, end_time)
+    query_id = start_insights_query(query, log_group, start_time, end_time)
+
+    access_logs = wait_for_insights_query(access_logs_query_id, True)
+    if access_logs:
+        access_log_message = "5XX errors found in access logs. Recommended article for review:\nhttps://repost.aws/knowledge-center/api-gateway-find-5xx-errors-cloudwatch"
+
+    cw_logs = wait_for_insights_query(query_id, False)
+    result = analyse_logs(cw_logs, access_log_message)
+    _cache_result(cache_key, result)
+    return result
\ No newline at end of file
@@ -10,8 +10,25 @@
 # permissions and limitations under the License.
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+CLIENT_CONFIG = Config(max_pool_connections=10, retries={"mode": "standard"})
+_APIGW = None
+
+
+def _apigw():
+    """
+    Return the API Gateway client, creating it on first use.
+
+    Note:
+        Kept at module scope so warm invocations reuse the client and its connection pool.
+    """
+    global _APIGW
+    if _APIGW is None:
+        _APIGW = boto3.client("apigateway", config=CLIENT_CONFIG)
+    return _APIGW
+
 
 def check_method_exists(event: dict, _) -> dict:
     """
@@ -31,7 +48,7 @@ def check_method_exists(event: dict, _) -> dict:
                   "Authorized": bool
               }
     """
-    apigw = boto3.client("apigateway")
+    apigw = _apigw()
     exists: bool = False
     authorized: bool = True
     api_id: str = event.get("RestApiId", "")
@@ -9,9 +9,61 @@
 # express or implied. See the License for the specific language governing
 # permissions and limitations under the License.
 
+import time
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+CLIENT_CONFIG = Config(max_pool_connections=10, retries={"mode": "standard"})
+RESOURCE_CACHE_TTL = 60
+_APIGW = None
+# api_id -> (time.monotonic() when fetched, {path: resource_id})
+_RESOURCE_CACHE: dict[str, tuple[float, dict[str, str]]] = {}
+
+
+def _apigw():
+    """
+    Return the API Gateway client, creating it on first use.
+
+    Note:
+        Kept at module scope so warm invocations reuse the client and its connection pool.
+    """
+    global _APIGW
+    if _APIGW is None:
+        _APIGW = boto3.client("apigateway", config=CLIENT_CONFIG)
+    return _APIGW
+
+
+def _resource_ids(apigw, api_id: str) -> dict:
+    """
+    Returns the mapping of resource paths to resource IDs for an API Gateway REST API.
+
+    Args:
+        apigw: API Gateway client
+        api_id (str): ID of the API Gateway REST API
+
+    Returns:
+        dict: Resource path to resource ID for every resource in the API
+
+    Raises:
+        ClientError: If the resources cannot be retrieved
+
+    Note:
+        The mapping is cached per API for RESOURCE_CACHE_TTL seconds, so repeated
+        checks against the same API in a warm container skip the GetResources calls.
+    """
+    cached = _RESOURCE_CACHE.get(api_id)
+    if cached and time.monotonic() - cached[0] < RESOURCE_CACHE_TTL:
+        return cached[1]
+
+    paginator = apigw.get_paginator("get_resources")
+    # 500 is the largest page size GetResources accepts
+    page_iterator = paginator.paginate(restApiId=api_id, PaginationConfig={"PageSize": 500})
+    resource_ids = {item["path"]: item["id"] for page in page_iterator for item in page["items"]}
+    _RESOURCE_CACHE[api_id] = (time.monotonic(), resource_ids)
+    return resource_ids
+
 
 def check_resource_exists(event: dict, _) -> dict:
     """
@@ -29,7 +81,7 @@ def check_resource_exists(event: dict, _) -> dict:
                   "ResourceId": str
               }
     """
-    apigw = boto3.client("apigateway")
+    apigw = _apigw()
     exists = False
     authorized = True
     api_id = event.get("RestApiId", "")
@@ -40,13 +92,8 @@ def check_resource_exists(event: dict, _) -> dict:
         return {"ResourceExists": exists, "Authorized": authorized, "ResourceId": resource_id}
 
     try:
-        paginator = apigw.get_paginator("get_resources")
-        page_iterator = paginator.paginate(restApiId=api_id)
-        for page in page_iterator:
-            for item in page["items"]:
-                if item["path"] == resource_path:
-                    exists = True
-                    resource_id = item["id"]
+        resource_id = _resource_ids(apigw, api_id).get(resource_path, "")
+        exists = bool(resource_id)
 
     except ClientError as e:
         error_code = e.response["Error"]["Code"]
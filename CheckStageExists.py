@@ -10,8 +10,25 @@
 # permissions and limitations under the License.
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+CLIENT_CONFIG = Config(max_pool_connections=10, retries={"mode": "standard"})
+_APIGW = None
+
+
+def _apigw():
+    """
+    Return the API Gateway client, creating it on first use.
+
+    Note:
+        Kept at module scope so warm invocations reuse the client and its connection pool.
+    """
+    global _APIGW
+    if _APIGW is None:
+        _APIGW = boto3.client("apigateway", config=CLIENT_CONFIG)
+    return _APIGW
+
 
 def check_stage_exists(event: dict, _) -> dict:
     """
@@ -29,7 +46,7 @@ def check_stage_exists(event: dict, _) -> dict:
                   "AccessLogGroup": str
               }
     """
-    apigw = boto3.client("apigateway")
+    apigw = _apigw()
     exists: bool = False
     authorized: bool = True
     api_id: str = event.get("RestApiId", "")
@@ -41,9 +58,9 @@ def check_stage_exists(event: dict, _) -> dict:
     else:
         try:
             response = apigw.get_stage(restApiId=api_id, stageName=api_stage)
-            exists = "stageName" in response and response["stageName"] == api_stage
-            if exists and "accessLogSettings" in response:
-                access_log_group = response["accessLogSettings"]["destinationArn"]
+            # GetStage raises NotFoundException for a missing stage, so a response means it exists
+            exists = True
+            access_log_group = response.get("accessLogSettings", {}).get("destinationArn", "")
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             if error_code == "NotFoundException":